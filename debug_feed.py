@@ -72,10 +72,10 @@ for url in urls:
 
     try:
         with urllib.request.urlopen(req, timeout=15) as resp:
-            xml_text = resp.read().decode("utf-8", errors="replace")
-            print(f"Fetched {len(xml_text)} bytes")
+            xml_bytes = resp.read()
+            print(f"Fetched {len(xml_bytes)} bytes")
             
-            root = ET.fromstring(xml_text)
+            root = ET.fromstring(xml_bytes)
             
             # Find items
             items = []
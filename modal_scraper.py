@@ -4,8 +4,8 @@ AINewz Modal Scraper
 Runs every 24 hours to fetch articles from:
   - Ben's Bites (RSS via Substack)
   - The Rundown AI (RSS by Beehiiv)
-  - Reddit r/artificial (RSS)
-  - Reddit r/MachineLearning (RSS)
+  - Reddit r/artificial (JSON API, RSS fallback)
+  - Reddit r/MachineLearning (JSON API, RSS fallback)
 
 Stores results in a Modal Dict and exposes a web endpoint
 so the frontend can load pre-fetched articles instantly.
@@ -15,23 +15,39 @@ Run now: modal run modal_scraper.py::fetch_and_store
 """
 
 import modal
-import json
-import urllib.request
-import urllib.error
-import xml.etree.ElementTree as ET
+import asyncio
 import re
+import time
+from xml.parsers import expat
 from datetime import datetime, timezone, timedelta
-from hashlib import md5
+from email.utils import parsedate_to_datetime
+from functools import partial
+from hashlib import blake2b
+from operator import itemgetter
 
 # ── App & persistent storage ─────────────────────────────────────────────────
 app = modal.App("ainewz-scraper")
 
-# Image with FastAPI for the web endpoint
-web_image = modal.Image.debian_slim().pip_install("fastapi[standard]")
+# Image with the scraper's HTTP/JSON libraries; the web endpoint adds FastAPI on top
+# (it falls back to running the scraper itself when the cache is empty)
+scraper_image = modal.Image.debian_slim().pip_install("aiohttp", "orjson")
+web_image = scraper_image.pip_install("fastapi[standard]")
+
+# Only installed in the image — `modal deploy` skips these when missing locally
+with scraper_image.imports():
+    import aiohttp
+    import orjson
+
+with web_image.imports():
+    from fastapi import Request
+    from fastapi.responses import Response
 
 # Persistent dict to store the latest articles JSON
 articles_store = modal.Dict.from_name("ainewz-articles", create_if_missing=True)
 
+# Per-URL HTTP validators (ETag / Last-Modified) and last parse, for conditional GETs
+feed_cache = modal.Dict.from_name("ainewz-feed-cache", create_if_missing=True)
+
 # ── Feed sources ──────────────────────────────────────────────────────────────
 SOURCES = [
     {
@@ -54,29 +70,76 @@ SOURCES = [
     {
         "key": "reddit",
         "label": "Reddit",
-        "type": "reddit_multi",  # Tries RSS first, then JSON API
+        "type": "reddit_json",  # JSON API first (no XML parse), RSS if it's blocked
         "urls": [
+            "https://www.reddit.com/r/artificial/new.json?limit=50",
+            "https://www.reddit.com/r/MachineLearning/new.json?limit=50",
+        ],
+        "rss_urls": [
             "https://old.reddit.com/r/artificial/new.rss?limit=50",
             "https://old.reddit.com/r/MachineLearning/new.rss?limit=50",
             "https://www.reddit.com/r/artificial/new.rss?limit=50",
             "https://www.reddit.com/r/MachineLearning/new.rss?limit=50",
         ],
-        "json_urls": [
-            "https://old.reddit.com/r/artificial/new.json?limit=50",
-            "https://old.reddit.com/r/MachineLearning/new.json?limit=50",
-        ],
     },
 ]
 
+# ── Feed parsing tables ───────────────────────────────────────────────────────
+ATOM = "{http://www.w3.org/2005/Atom}"
+DC = "{http://purl.org/dc/elements/1.1/}"
+CONTENT = "{http://purl.org/rss/1.0/modules/content/}"
+
+# Tags that mark one article: RSS 2.0 <item> and Atom <entry>
+ITEM_TAGS = ("item", ATOM + "entry")
+
+# Per feed flavour: the keys (element tag, or "tag@attr" for attributes) that
+# RSSHandler collects each field under, tried in order. Chosen once per feed.
+RSS_FIELDS = {
+    "title": ("title",),
+    "link": ("link",),
+    "published": ("pubDate", DC + "date"),
+    "summary": ("description",),
+    "content": (CONTENT + "encoded",),
+    "author": ("author", DC + "creator"),
+    "enclosure_url": ("enclosure@url",),
+    "enclosure_type": ("enclosure@type",),
+}
+ATOM_FIELDS = {
+    "title": (ATOM + "title",),
+    "link": (ATOM + "link@href",),
+    "published": (ATOM + "published", ATOM + "updated"),
+    "summary": (ATOM + "summary",),
+    "content": (ATOM + "content",),
+    "author": (ATOM + "name",),
+    "enclosure_url": (),
+    "enclosure_type": (),
+}
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_IMG_RE = re.compile(r'<img[^>]+src="([^">]+)"')
+
 ARTICLE_WINDOW_HOURS = 72  # 72h covers weekend publishing gaps (newsletters skip Sat/Sun)
+FETCH_TIMEOUT = 15  # Seconds per request, including redirects
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 def hash_url(url: str) -> str:
-    return md5(url.encode()).hexdigest()[:12]
+    # Non-cryptographic id; a 6-byte digest is exactly 12 hex chars, no slicing
+    return blake2b(url.encode(), digest_size=6).hexdigest()
+
+
+# Returned by fetch_url when the server answers 304 — reuse the cached parse
+NOT_MODIFIED = object()
 
 
-def fetch_url(url: str, timeout: int = 15, is_reddit: bool = False) -> str | None:
-    """Fetch a URL with redirect following and appropriate User-Agent."""
+async def fetch_url(session, url: str, cache_entry: dict | None = None, is_reddit: bool = False):
+    """Fetch a URL on the shared aiohttp session with an appropriate User-Agent.
+
+    Returns the raw body bytes — the XML parser reads the encoding from the
+    document itself, so there is no decode pass. When `cache_entry` holds
+    validators from a previous run, the request is made conditional and
+    NOT_MODIFIED is returned on a 304. The entry is refreshed in place with
+    the response's ETag / Last-Modified.
+    """
     if is_reddit:
         # Reddit API guidelines require a descriptive user-agent
         user_agent = "Mozilla/5.0 (compatible; GlaidoDashboard/1.0; +https://scraper-wine-delta.vercel.app)"
@@ -84,29 +147,44 @@ def fetch_url(url: str, timeout: int = 15, is_reddit: bool = False) -> str | Non
     else:
         user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
         accept = "application/rss+xml, application/xml, text/xml, */*"
-    req = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": user_agent,
-            "Accept": accept,
-            "Accept-Language": "en-US,en;q=0.9",
-        },
-    )
+    headers = {
+        "User-Agent": user_agent,
+        "Accept": accept,
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+    if cache_entry:
+        if cache_entry.get("etag"):
+            headers["If-None-Match"] = cache_entry["etag"]
+        if cache_entry.get("last_modified"):
+            headers["If-Modified-Since"] = cache_entry["last_modified"]
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.read().decode("utf-8", errors="replace")
+        async with session.get(url, headers=headers) as resp:
+            if resp.status == 304:
+                return NOT_MODIFIED
+            if resp.status >= 400:
+                print(f"[fetch] Failed {url}: HTTP {resp.status}")
+                return None
+            if cache_entry is not None:
+                cache_entry["etag"] = resp.headers.get("ETag")
+                cache_entry["last_modified"] = resp.headers.get("Last-Modified")
+            return await resp.read()
     except Exception as e:
         print(f"[fetch] Failed {url}: {e}")
         return None
 
 
-def parse_reddit_json(json_text: str, source_key: str, source_label: str) -> list[dict]:
+def still_recent(articles: list[dict]) -> list[dict]:
+    """Drop cached articles that have aged out of the article window."""
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=ARTICLE_WINDOW_HOURS)
+    return [a for a in articles if datetime.fromisoformat(a["published_at"]) >= cutoff]
+
+
+def parse_reddit_json(json_text: bytes, source_key: str, source_label: str) -> list[dict]:
     """Parse Reddit's JSON API response into Article objects."""
-    import json as _json
     articles = []
     cutoff = datetime.now(timezone.utc) - timedelta(hours=ARTICLE_WINDOW_HOURS)
     try:
-        data = _json.loads(json_text)
+        data = orjson.loads(json_text)
         children = data.get("data", {}).get("children", [])
     except Exception as e:
         print(f"[parse_reddit_json] Parse error: {e}")
@@ -148,113 +226,287 @@ def parse_reddit_json(json_text: str, source_key: str, source_label: str) -> lis
     return articles
 
 
-def parse_rss(xml_text: str, source_key: str, source_label: str) -> list[dict]:
-    """Robust RSS/Atom parser that ignores namespaces."""
+class RSSHandler:
+    """Expat callbacks that collect item/entry fields without building a tree.
+
+    Each finished <item>/<entry> is appended to `items` as a dict mapping
+    "tag" (text) or "tag@attr" (attribute) to the first non-empty value seen
+    inside it. Namespaced tags use "{uri}local" notation. Direct children
+    carrying a `url` attribute (media:thumbnail, media:content, ...) are also
+    listed under "_media" for thumbnail lookup.
+    """
+
+    def __init__(self):
+        self.items = []
+        self._cur = None  # Fields of the item being read
+        self._depth = 0   # Element depth inside the current item
+        self._buf = []    # Text of the innermost open element
+        self._bufs = []   # Text buffers of its open ancestors
+
+    def start(self, name, attrs):
+        tag = "{" + name if "}" in name else name
+        if self._cur is None:
+            if tag in ITEM_TAGS:
+                self._cur = {"_tag": tag, "_media": []}
+                self._depth = 0
+            return
+        self._depth += 1
+        for attr, value in attrs.items():
+            if value:
+                self._cur.setdefault(f"{tag}@{attr}", value)
+        if self._depth == 1 and "url" in attrs:
+            self._cur["_media"].append((tag, attrs))
+        self._bufs.append(self._buf)
+        self._buf = []
+
+    def data(self, text):
+        if self._cur is not None:
+            self._buf.append(text)
+
+    def end(self, name):
+        if self._cur is None:
+            return
+        if self._depth == 0:
+            self.items.append(self._cur)
+            self._cur = None
+            self._buf = []
+            return
+        tag = "{" + name if "}" in name else name
+        text = "".join(self._buf)
+        if text:
+            self._cur.setdefault(tag, text)
+        self._buf = self._bufs.pop()
+        self._depth -= 1
+
+
+def parse_rss(xml_bytes: bytes, source_key: str, source_label: str, known: dict | None = None) -> list[dict]:
+    """Streaming RSS/Atom parser — Expat callbacks, no element tree.
+
+    `known` maps article ids from the previous run to their stored Article;
+    items already in it are reused as-is instead of being rebuilt.
+    """
     articles = []
     cutoff = datetime.now(timezone.utc) - timedelta(hours=ARTICLE_WINDOW_HOURS)
 
+    handler = RSSHandler()
+    parser = expat.ParserCreate(namespace_separator="}")
+    parser.buffer_text = True
+    parser.StartElementHandler = handler.start
+    parser.EndElementHandler = handler.end
+    parser.CharacterDataHandler = handler.data
     try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError as e:
+        parser.Parse(xml_bytes, True)
+    except (expat.ExpatError, ValueError, LookupError) as e:
+        # Malformed XML, or a declared encoding Expat can't read (multi-byte
+        # like gbk raises ValueError, unknown names LookupError). Keep
+        # whatever items were complete before the error.
         print(f"[parse] XML error: {e}")
-        return []
 
-    # Iterate over all items/entries regardless of namespace
-    items = []
-    for elem in root.iter():
-        if elem.tag.endswith("item") or elem.tag.endswith("entry"):
-            items.append(elem)
-
-    for item in items:
-        # Helper to find child text safely ignoring namespace
-        def get_text(tag_suffix):
-            for child in item:
-                if child.tag.endswith(tag_suffix):
-                    return child.text or ""
-            return ""
-
-        def get_attr(tag_suffix, attr_name):
-            for child in item:
-                if child.tag.endswith(tag_suffix):
-                    return child.get(attr_name)
-            return None
-
-        title = get_text("title") or "Untitled"
-        link = get_text("link") or get_attr("link", "href") or "#"
-        pub_raw = get_text("pubDate") or get_text("published") or get_text("updated")
-        desc = get_text("description") or get_text("summary")
-        content = get_text("encoded") or get_text("content") or ""
-        author = get_text("author") or get_text("creator") or source_label
-
-        # Parse date
+    fields = parse_date = None
+    for values in handler.items:
+        if fields is None:
+            # RSS dates are RFC 822, Atom dates are ISO 8601
+            if values["_tag"] == ITEM_TAGS[1]:
+                fields, parse_date = ATOM_FIELDS, _parse_iso_date
+            else:
+                fields, parse_date = RSS_FIELDS, _parse_rfc822_date
+        article = _parse_item(values, fields, parse_date, source_key, source_label, cutoff, known)
+        if article:
+            articles.append(article)
+
+    return articles
+
+
+def _parse_rfc822_date(raw: str) -> datetime:
+    dt = parsedate_to_datetime(raw)
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _parse_iso_date(raw: str) -> datetime:
+    dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _find_text(values: dict[str, str], keys: tuple[str, ...]) -> str:
+    """Return the first non-empty value among the given keys."""
+    for key in keys:
+        text = values.get(key)
+        if text:
+            return text
+    return ""
+
+
+def _parse_item(values: dict, fields: dict, parse_date, source_key: str, source_label: str, cutoff: datetime,
+                known: dict | None = None) -> dict | None:
+    """Turn one item's collected fields into an Article, or None if too old."""
+    pub_raw = _find_text(values, fields["published"])
+
+    # Parse date with the feed's format; only a malformed date tries the other one
+    try:
+        pub_dt = parse_date(pub_raw)
+    except (TypeError, ValueError):
+        other = _parse_rfc822_date if parse_date is _parse_iso_date else _parse_iso_date
         try:
-            from email.utils import parsedate_to_datetime
-            pub_dt = parsedate_to_datetime(pub_raw)
-            if pub_dt.tzinfo is None:
-                pub_dt = pub_dt.replace(tzinfo=timezone.utc)
-        except Exception:
-            try:
-                pub_dt = datetime.fromisoformat(pub_raw.replace("Z", "+00:00"))
-            except Exception:
-                pub_dt = datetime.now(timezone.utc)
+            pub_dt = other(pub_raw)
+        except (TypeError, ValueError):
+            # Unparseable date — treat as just outside the window so it's dropped
+            pub_dt = cutoff - timedelta(seconds=1)
 
-        if pub_dt < cutoff:
-            continue
+    # Stale items stop here, before any of the text handling below
+    if pub_dt < cutoff:
+        return None
 
-        # Strip HTML from description
-        clean_desc = re.sub(r"<[^>]+>", "", desc).strip()
-        if len(clean_desc) > 300:
-            clean_desc = clean_desc[:300] + "…"
-        if not clean_desc and len(content) > 0:
-             clean_content = re.sub(r"<[^>]+>", "", content).strip()
-             clean_desc = clean_content[:300] + "…"
-
-        # Image extraction logic
-        thumbnail = None
-        
-        # 1. Check media:thumbnail / media:content
-        for child in item:
-            tag = child.tag.lower()
-            if tag.endswith("thumbnail") or tag.endswith("content"):
-                url = child.get("url")
-                typ = child.get("type") or ""
-                if url and (url.endswith(('.jpg', '.png', '.jpeg', '.webp')) or 'image' in typ):
-                    thumbnail = url
-                    break
-        
-        # 2. Check enclosure
-        if not thumbnail:
-            enc_url = get_attr("enclosure", "url")
-            enc_type = get_attr("enclosure", "type")
-            if enc_url and ('image' in (enc_type or "") or enc_url.endswith(('.jpg', '.png', '.jpeg'))):
-                thumbnail = enc_url
-
-        # 3. Regex on content/description
-        if not thumbnail:
-            full_html = (desc or "") + (content or "")
-            img_match = re.search(r'<img[^>]+src="([^">]+)"', full_html)
-            if img_match:
-                thumbnail = img_match.group(1)
+    link = _find_text(values, fields["link"]) or "#"
+    article_id = hash_url(link)
+    if known:
+        previous = known.get(article_id)
+        if previous and previous["source"] == source_key:
+            return previous
+
+    title = _find_text(values, fields["title"]) or "Untitled"
+    desc = _find_text(values, fields["summary"])
+    content = _find_text(values, fields["content"])
+    author = _find_text(values, fields["author"]) or source_label
+
+    # Strip HTML from description
+    clean_desc = _TAG_RE.sub("", desc).strip()
+    if len(clean_desc) > 300:
+        clean_desc = clean_desc[:300] + "…"
+    if not clean_desc and len(content) > 0:
+         clean_content = _TAG_RE.sub("", content).strip()
+         clean_desc = clean_content[:300] + "…"
+
+    # Image extraction logic
+    thumbnail = None
+    
+    # 1. Check media:thumbnail / media:content
+    for tag, attrs in values["_media"]:
+        tag = tag.lower()
+        if tag.endswith("thumbnail") or tag.endswith("content"):
+            url = attrs.get("url")
+            typ = attrs.get("type") or ""
+            if url and (url.endswith(('.jpg', '.png', '.jpeg', '.webp')) or 'image' in typ):
+                thumbnail = url
+                break
+    
+    # 2. Check enclosure
+    if not thumbnail:
+        enc_url = _find_text(values, fields["enclosure_url"])
+        enc_type = _find_text(values, fields["enclosure_type"])
+        if enc_url and ('image' in (enc_type or "") or enc_url.endswith(('.jpg', '.png', '.jpeg'))):
+            thumbnail = enc_url
+
+    # 3. Regex on content/description
+    if not thumbnail:
+        full_html = (desc or "") + (content or "")
+        img_match = _IMG_RE.search(full_html)
+        if img_match:
+            thumbnail = img_match.group(1)
+
+    return {
+        "id": article_id,
+        "title": title.strip(),
+        "summary": clean_desc,
+        "url": link,
+        "source": source_key,
+        "source_label": source_label,
+        "published_at": pub_dt.isoformat(),
+        "author": author.strip() or source_label,
+        "score": None,
+        "thumbnail": thumbnail,
+        "saved": False,
+    }
 
-        articles.append({
-            "id": hash_url(link),
-            "title": title.strip(),
-            "summary": clean_desc,
-            "url": link,
-            "source": source_key,
-            "source_label": source_label,
-            "published_at": pub_dt.isoformat(),
-            "author": author.strip() or source_label,
-            "score": None,
-            "thumbnail": thumbnail,
-            "saved": False,
-        })
 
-    return articles
+# Parser for each source "type"
+FEED_PARSERS = {
+    "rss": parse_rss,
+    "reddit_json": parse_reddit_json,
+}
+
+
+# ── Async fetching ────────────────────────────────────────────────────────────
+async def parse_off_loop(parse, body: bytes, source: dict, url: str) -> list[dict]:
+    """Run a parser in the default executor; a parser error fails this URL, not the whole run."""
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(None, parse, body, source["key"], source["label"])
+    except Exception as e:
+        print(f"[scraper] {source['key']}: parse failed for {url}: {e}")
+        return []
+
+
+async def scrape_source(session, source: dict, cache_entries: dict, cache_updates: dict, known: dict) -> list[dict]:
+    """Fetch a source's URLs concurrently; return articles from the first, in priority order, that has any."""
+    parse = FEED_PARSERS[source["type"]]
+    if parse is parse_rss:
+        parse = partial(parse_rss, known=known)
+    is_reddit = source["type"] == "reddit_json"
+
+    tasks = []
+    for url in source["urls"]:
+        print(f"[scraper] Fetching {source['key']} from {url}")
+        tasks.append(asyncio.create_task(fetch_url(session, url, cache_entries[url], is_reddit=is_reddit)))
+
+    try:
+        for url, task in zip(source["urls"], tasks):
+            body = await task
+            cache_entry = cache_entries[url]
+            new_articles = []
+            if body is NOT_MODIFIED:
+                new_articles = still_recent(cache_entry.get("articles", []))
+                print(f"[scraper] {source['key']}: 304 Not Modified — reusing cached parse of {url}")
+            elif body and len(body) > 200:
+                body_hash = blake2b(body, digest_size=16).hexdigest()
+                if body_hash == cache_entry.get("body_hash"):
+                    # Server ignored the validators but the body is unchanged
+                    new_articles = still_recent(cache_entry.get("articles", []))
+                else:
+                    # Parse off the event loop so other fetches keep flowing
+                    new_articles = await parse_off_loop(parse, body, source, url)
+                cache_updates[url] = {**cache_entry, "body_hash": body_hash, "articles": new_articles}
+                if not new_articles:
+                    print(f"[scraper] {source['key']}: parsed 0 articles from {url}")
+            else:
+                print(f"[scraper] {source['key']}: empty/failed response from {url}")
+
+            if new_articles:
+                print(f"[scraper] {source['key']}: {len(new_articles)} articles ({source['type']})")
+                return new_articles
+    finally:
+        # Lower-priority fetches still in flight are no longer needed
+        for task in tasks:
+            task.cancel()
+
+    # For Reddit: if the JSON API is blocked (datacenter IPs), fall back to RSS
+    if source.get("rss_urls"):
+        print(f"[scraper] {source['key']}: JSON API failed — trying RSS fallback")
+        for rss_url in source["rss_urls"]:
+            print(f"[scraper] {source['key']} RSS: {rss_url}")
+            body = await fetch_url(session, rss_url, is_reddit=True)
+            if body and len(body) > 200:
+                new_articles = await parse_off_loop(partial(parse_rss, known=known), body, source, rss_url)
+                if new_articles:
+                    print(f"[scraper] {source['key']}: {len(new_articles)} articles from RSS")
+                    return new_articles
+                else:
+                    print(f"[scraper] {source['key']} RSS: 0 articles from {rss_url}")
+
+    return []
+
+
+async def scrape_all(cache_entries: dict, cache_updates: dict, known: dict) -> list[list[dict]]:
+    """Scrape every source at once on one session — wall time is the slowest feed, not the sum."""
+    timeout = aiohttp.ClientTimeout(total=FETCH_TIMEOUT)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        return await asyncio.gather(
+            *(scrape_source(session, source, cache_entries, cache_updates, known) for source in SOURCES)
+        )
 
 
 # ── Core scrape function ──────────────────────────────────────────────────────
 @app.function(
+    image=scraper_image,
     timeout=120,
     retries=2,
 )
@@ -263,56 +515,28 @@ def fetch_and_store():
     all_articles = []
     errors = []
 
-    for source in SOURCES:
-        fetched = False
-        is_reddit = source["type"] == "reddit_multi"
-
-        # Try RSS/XML URLs first
-        for url in source["urls"]:
-            print(f"[scraper] Fetching {source['key']} from {url}")
-            xml_text = fetch_url(url, is_reddit=is_reddit)
-            if xml_text and len(xml_text) > 200:
-                new_articles = parse_rss(xml_text, source["key"], source["label"])
-                if new_articles:
-                    print(f"[scraper] {source['key']}: {len(new_articles)} articles from RSS")
-                    all_articles.extend(new_articles)
-                    fetched = True
-                    break
-                else:
-                    print(f"[scraper] {source['key']}: parsed 0 articles from {url}")
-            else:
-                print(f"[scraper] {source['key']}: empty/failed response from {url}")
-
-        # For Reddit: if RSS failed, try JSON API
-        if not fetched and is_reddit and source.get("json_urls"):
-            print(f"[scraper] Reddit RSS failed — trying JSON API fallback")
-            for json_url in source["json_urls"]:
-                print(f"[scraper] Reddit JSON: {json_url}")
-                json_text = fetch_url(json_url, is_reddit=True)
-                if json_text and len(json_text) > 200:
-                    new_articles = parse_reddit_json(json_text, source["key"], source["label"])
-                    if new_articles:
-                        print(f"[scraper] reddit: {len(new_articles)} articles from JSON API")
-                        all_articles.extend(new_articles)
-                        fetched = True
-                        break
-                    else:
-                        print(f"[scraper] reddit JSON: 0 articles from {json_url}")
-
-        if not fetched:
+    # Modal Dict I/O stays outside the event loop; cache writes are batched after
+    cache_entries = {url: feed_cache.get(url) or {} for source in SOURCES for url in source["urls"]}
+    cache_updates = {}
+    # Articles stored by the previous run, by id — RSS items already seen are reused
+    previous = articles_store.get("latest")
+    known = {a["id"]: a for a in orjson.loads(previous)["articles"]} if previous else {}
+    results = asyncio.run(scrape_all(cache_entries, cache_updates, known))
+    if cache_updates:
+        feed_cache.update(cache_updates)
+
+    for source, new_articles in zip(SOURCES, results):
+        if new_articles:
+            all_articles.extend(new_articles)
+        else:
             errors.append(source["label"])
             print(f"[scraper] FAILED: {source['key']}")
 
-    # Deduplicate by id
-    seen = set()
-    unique = []
-    for a in all_articles:
-        if a["id"] not in seen:
-            seen.add(a["id"])
-            unique.append(a)
+    # Deduplicate by id — iterating in reverse keeps the first occurrence of each id
+    unique = list({a["id"]: a for a in reversed(all_articles)}.values())
 
     # Sort newest first
-    unique.sort(key=lambda a: a["published_at"], reverse=True)
+    unique.sort(key=itemgetter("published_at"), reverse=True)
 
     payload = {
         "articles": unique,
@@ -321,36 +545,56 @@ def fetch_and_store():
         "count": len(unique),
     }
 
-    articles_store["latest"] = json.dumps(payload)
+    # Stored pre-serialized so the web endpoint can serve the bytes as-is
+    articles_store["latest"] = orjson.dumps(payload)
+    # Bumped after "latest" is written, so web containers know to reload it
+    articles_store["gen"] = time.time()
     print(f"[scraper] Done. {len(unique)} articles stored. Errors: {errors}")
     return payload
 
 
 # ── Web endpoint — serves cached articles as JSON ─────────────────────────────
+# Per-container copy of the latest payload, keyed by the scrape generation
+_CACHE = {"gen": None, "bytes": None, "etag": None}
+
+
 @app.function(image=web_image)
 @modal.web_endpoint(method="GET")
-def get_articles():
-    """Returns the latest cached articles as JSON."""
-    from fastapi.responses import JSONResponse
-
-    raw = articles_store.get("latest")
-    if not raw:
-        # No cache yet — run a fresh fetch
-        payload = fetch_and_store.local()
-    else:
-        payload = json.loads(raw)
-
-    return JSONResponse(
-        content=payload,
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Cache-Control": "public, max-age=3600",
-        },
+def get_articles(request: "Request"):
+    """Returns the latest cached articles as JSON, or 304 if the client's copy is current."""
+    # One small Dict read per request; the payload is only re-read after a new scrape
+    gen = articles_store.get("gen")
+    if gen is None or gen != _CACHE["gen"]:
+        raw = articles_store.get("latest")
+        if not raw:
+            # No cache yet — run a fresh fetch
+            raw = orjson.dumps(fetch_and_store.local())
+            gen = articles_store.get("gen")
+        if isinstance(raw, str):
+            raw = raw.encode()  # Payload left by a deploy that stored str
+        # Derived from the bytes just loaded, so the ETag always matches the body
+        etag = f'"{blake2b(raw, digest_size=8).hexdigest()}"'
+        _CACHE.update(gen=gen, bytes=raw, etag=etag)
+
+    headers = {
+        "Access-Control-Allow-Origin": "*",
+        "Cache-Control": "public, max-age=3600",
+        "ETag": _CACHE["etag"],
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if _CACHE["etag"] in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=_CACHE["bytes"],
+        media_type="application/json",
+        headers=headers,
     )
 
 
 # ── Scheduled job — runs every 24 hours ───────────────────────────────────────
 @app.function(
+    image=scraper_image,
     schedule=modal.Cron("0 6 * * *"),  # 6:00 AM UTC daily
 )
 def scheduled_scrape():
@@ -2,21 +2,26 @@
 tools/verify_feeds.py
 ─────────────────────
 Phase 2 — Link Verification
-Hits all 4 feed endpoints and reports status + article count.
+Hits all 4 feed endpoints concurrently and reports status + article count.
 Run: python tools/verify_feeds.py
 """
 
+import io
 import sys
 import json
 import time
 import urllib.request
 import urllib.error
-import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
-from xml.etree import ElementTree as ET
+from email.utils import parsedate_to_datetime
+from lxml import etree as ET
 
 CUTOFF = datetime.now(timezone.utc) - timedelta(hours=24)
 
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+ITEM_TAGS = ("item", ATOM_NS + "entry")
+
 SOURCES = [
     {
         "name": "Ben's Bites (Beehiiv RSS)",
@@ -50,28 +55,39 @@ def fetch(url, timeout=12):
     req = urllib.request.Request(url, headers=HEADERS)
     try:
         with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.read().decode("utf-8", errors="replace"), resp.status
+            # Raw bytes — lxml takes the encoding from the XML declaration, json.loads detects UTF-8/16/32
+            return resp.read(), resp.status
     except urllib.error.HTTPError as e:
         return None, e.code
     except Exception as e:
         return None, str(e)
 
 
-def count_rss_items(xml_text):
+def timed_fetch(url):
+    t0 = time.time()
+    body, status = fetch(url)
+    return body, status, time.time() - t0
+
+
+def count_rss_items(xml_bytes):
+    total = 0
+    recent = 0
+    context = ET.iterparse(
+        io.BytesIO(xml_bytes),
+        events=("end",),
+        tag=ITEM_TAGS,
+        recover=True,
+    )
     try:
-        root = ET.fromstring(xml_text)
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-        items = root.findall(".//item") or root.findall(".//atom:entry", ns)
-        recent = 0
-        for item in items:
+        for _, item in context:
+            total += 1
             pub = (
                 item.findtext("pubDate")
-                or item.findtext("{http://www.w3.org/2005/Atom}published")
-                or item.findtext("{http://www.w3.org/2005/Atom}updated")
+                or item.findtext(ATOM_NS + "published")
+                or item.findtext(ATOM_NS + "updated")
             )
             if pub:
                 try:
-                    from email.utils import parsedate_to_datetime
                     dt = parsedate_to_datetime(pub)
                     if dt.tzinfo is None:
                         dt = dt.replace(tzinfo=timezone.utc)
@@ -79,14 +95,18 @@ def count_rss_items(xml_text):
                         recent += 1
                 except Exception:
                     recent += 1  # count if can't parse date
-        return len(items), recent
+
+            item.clear()
+            while item.getprevious() is not None:
+                del item.getparent()[0]
+        return total, recent
     except ET.ParseError as e:
         return 0, 0
 
 
-def count_reddit_posts(json_text):
+def count_reddit_posts(json_bytes):
     try:
-        data = json.loads(json_text)
+        data = json.loads(json_bytes)
         posts = data.get("data", {}).get("children", [])
         recent = sum(
             1 for p in posts
@@ -103,14 +123,19 @@ def main():
     print(f"  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  |  24h cutoff: {CUTOFF.strftime('%H:%M UTC')}")
     print("═" * 56)
 
+    # Hit every endpoint at once; results are printed in SOURCES order below
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(SOURCES)) as ex:
+        futures = {ex.submit(timed_fetch, src["url"]): src for src in SOURCES}
+        for fut in as_completed(futures):
+            results[futures[fut]["name"]] = fut.result()
+
     all_ok = True
     for src in SOURCES:
         print(f"\n▶  {src['name']}")
         print(f"   URL: {src['url']}")
 
-        t0 = time.time()
-        body, status = fetch(src["url"])
-        elapsed = time.time() - t0
+        body, status, elapsed = results[src["name"]]
 
         if body is None:
             print(f"   ❌ FAILED  (status={status}, {elapsed:.1f}s)")